@@ -1,84 +1,142 @@
 from collections import UserDict
-import re
-from datetime import datetime, timedelta
+import calendar
+from datetime import date, timedelta
+from functools import lru_cache
 
-# Base class for record fields
-class Field:
-    def __init__(self, value):
-        self.value = value
-
-    def __str__(self):
-        return str(self.value)
+# Maps ASCII digit bytes to 0 and every other byte to 1.
+_DIGITS_LUT = bytes(0 if 48 <= b <= 57 else 1 for b in range(256))
 
-# Class for storing the name of a contact
-class Name(Field):
-    pass
-
-# Class for storing a phone number with validation for format (10 digits)
-class Phone(Field):
-    def __init__(self, value):
-        if self._validate(value):
-            super().__init__(value)
-        else:
-            raise ValueError("Invalid phone number format. It should be 10 digits.")
-
-    def _validate(self, value):
-        return re.fullmatch(r"\d{10}", value) is not None
+@lru_cache(maxsize=1024)
+def _validate_phone(value):
+    # Check the phone number format (10 digits). Cached for repeated numbers.
+    # Non-ASCII characters are encoded as "?" and so are rejected too.
+    if len(value) != 10:
+        return False
+    return b"\x01" not in value.encode("ascii", "replace").translate(_DIGITS_LUT)
 
 # Class for storing a birthday with validation for date format (DD.MM.YYYY)
-class Birthday(Field):
+class Birthday:
+    __slots__ = ("value", "formatted")
+
     def __init__(self, value):
+        # Split by hand instead of strptime. Same DD.MM.YYYY layout, but unlike
+        # strptime (whose \d matches any Unicode digit) only ASCII digits are accepted.
         try:
-            self.value = datetime.strptime(value, "%d.%m.%Y")
+            day, month, year = value.split(".")
+            # strptime's %d also accepts a space-padded day such as " 1".
+            if len(day) == 2 and day[0] == " ":
+                day = day[1:]
+            digits = day + month + year
+            if not (len(day) <= 2 and len(month) <= 2 and len(year) == 4
+                    and digits.isascii() and digits.isdigit()):
+                raise ValueError
+            self.value = date(int(year), int(month), int(day))
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        # Format once here so displaying the birthday is a plain attribute read.
+        self.formatted = f"{self.value.day:02d}.{self.value.month:02d}.{self.value.year:04d}"
+
+    def __str__(self):
+        return self.formatted
 
 # Class for storing information about a contact
 class Record:
+    __slots__ = ("name", "phones", "birthday", "_str_cache", "_book")
+
     def __init__(self, name):
-        self.name = Name(name)  
-        self.phones = []  
+        # Name and phones are stored as plain strings.
+        self.name = name
+        self.phones = {}  # phone -> phone, keeps insertion order
         self.birthday = None  
+        self._str_cache = None  # rendered __str__, reset on every change
+        self._book = None  # AddressBook holding the record, kept by the book
 
     def add_phone(self, phone):
         # Add a new phone number to the contact.
-        self.phones.append(Phone(phone))
+        if not _validate_phone(phone):
+            raise ValueError("Invalid phone number format. It should be 10 digits.")
+        self.phones[phone] = phone
+        self._str_cache = None
 
     def remove_phone(self, phone):
         # Remove a phone number from the contact.
-        phone_to_remove = self.find_phone(phone)
-        if phone_to_remove:
-            self.phones.remove(phone_to_remove)
+        self.phones.pop(phone, None)
+        self._str_cache = None
 
     def edit_phone(self, old_phone, new_phone):
         # Edit a phone number in the contact.
-        phone_to_edit = self.find_phone(old_phone)
-        if phone_to_edit:
-            self.phones.remove(phone_to_edit)
+        if old_phone in self.phones:
+            # add_phone raises before changing anything if new_phone is invalid.
             self.add_phone(new_phone)
+            if new_phone != old_phone:
+                del self.phones[old_phone]
+            self._str_cache = None
 
     def find_phone(self, phone):
-        # Find a phone number in the list.
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        # Find a phone number of the contact.
+        return self.phones.get(phone)
 
     def add_birthday(self, birthday):
         # Add a birthday to the contact. 
-        self.birthday = Birthday(birthday)
+        birthday = Birthday(birthday)
+        # Keep the birthday index of the containing address book up to date.
+        if self._book is not None:
+            self._book._unindex_birthday(self)
+        self.birthday = birthday
+        self._str_cache = None
+        if self._book is not None:
+            self._book._index_birthday(self)
 
     def __str__(self):
         # Return a string representation of the contact in a readable format. 
-        phones = '; '.join(p.value for p in self.phones)
-        birthday = self.birthday.value.strftime("%d.%m.%Y") if self.birthday else "N/A"
-        return f"Contact name: {self.name.value}, phones: {phones}, birthday: {birthday}"
+        if self._str_cache is None:
+            phones = '; '.join(self.phones)
+            birthday = self.birthday.formatted if self.birthday else "N/A"
+            self._str_cache = f"Contact name: {self.name}, phones: {phones}, birthday: {birthday}"
+        return self._str_cache
 
 # Class for managing and storing address book records
 class AddressBook(UserDict):
+    def __init__(self):
+        # (month, day) -> records with a birthday on that day
+        self._by_mmdd = {}
+        super().__init__()
+
+    def _index_birthday(self, record):
+        # Add a record to the birthday index.
+        if record.birthday:
+            key = (record.birthday.value.month, record.birthday.value.day)
+            self._by_mmdd.setdefault(key, []).append(record)
+
+    def _unindex_birthday(self, record):
+        # Remove a record from the birthday index.
+        if record.birthday:
+            key = (record.birthday.value.month, record.birthday.value.day)
+            records = self._by_mmdd.get(key, [])
+            if record in records:
+                records.remove(record)
+
+    def __setitem__(self, name, record):
+        # Every insertion (including update/setdefault) goes through here,
+        # so the birthday index is maintained in one place.
+        # A record belongs to one address book at a time.
+        old_record = self.data.get(name)
+        if old_record:
+            self._unindex_birthday(old_record)
+            old_record._book = None
+        self.data[name] = record
+        record._book = self
+        self._index_birthday(record)
+
+    def __delitem__(self, name):
+        # Every removal (including pop/popitem/clear) goes through here.
+        record = self.data.pop(name)
+        self._unindex_birthday(record)
+        record._book = None
+
     def add_record(self, record):
         # Add a record to the address book. 
-        self.data[record.name.value] = record
+        self[record.name] = record
 
     def find(self, name):
         # Find a record by name.
@@ -87,18 +145,24 @@ class AddressBook(UserDict):
     def delete(self, name):
         # Delete a record by name.
         if name in self.data:
-            del self.data[name]
+            del self[name]
 
     def get_upcoming_birthdays(self, days=7):
         # Return a list of contacts with upcoming birthdays within the next few days.
-        today = datetime.now()
+        by_mmdd = self._by_mmdd
+        one_day = timedelta(days=1)
+        day = date.today()
         upcoming_birthdays = []
-        for record in self.data.values():
-            if record.birthday:
-                next_birthday = record.birthday.value.replace(year=today.year)
-                if today <= next_birthday <= (today + timedelta(days=days)):
-                    upcoming_birthdays.append(record)
-        return upcoming_birthdays
+        # A year covers every birthday; walking further would only repeat dates.
+        for _ in range(min(days, 365) + 1):
+            month, mday = day.month, day.day
+            upcoming_birthdays.extend(by_mmdd.get((month, mday), ()))
+            # Feb 29 birthdays are celebrated on Feb 28 in non-leap years.
+            if month == 2 and mday == 28 and not calendar.isleap(day.year):
+                upcoming_birthdays.extend(by_mmdd.get((2, 29), ()))
+            day += one_day
+        # A full-year window can reach today's date again (or fold Feb 29 twice).
+        return list(dict.fromkeys(upcoming_birthdays))
 
 # Command handling functions
 def handle_add_contact(book, name, phone, email, favorite, birthday=None):
@@ -117,10 +181,7 @@ def handle_list_contacts(book):
     # Handle the command to list all contacts. 
     if not book.data:
         return "Address book is empty."
-    result = ["Contacts in address book:"]
-    for name, record in book.data.items():
-        result.append(str(record))
-    return "\n".join(result)
+    return "Contacts in address book:\n" + "\n".join(str(record) for record in book.data.values())
 
 def handle_get_contact(book, name):
     # Handle the command to get a contact by name.
@@ -156,56 +217,69 @@ def handle_upcoming_birthdays(book, days=7):
     upcoming_birthdays = book.get_upcoming_birthdays(days)
     if not upcoming_birthdays:
         return "No upcoming birthdays within the next week."
-    result = ["Upcoming birthdays:"]
-    for record in upcoming_birthdays:
-        result.append(f"{record.name.value} on {record.birthday.value.strftime('%d.%m.%Y')}")
-    return "\n".join(result)
+    return "Upcoming birthdays:\n" + "\n".join(
+        f"{record.name} on {record.birthday.formatted}" for record in upcoming_birthdays
+    )
+
+HANDLERS = {
+    "add": handle_add_contact,
+    "list": handle_list_contacts,
+    "get": handle_get_contact,
+    "remove": handle_remove_contact,
+    "edit": handle_edit_contact_phone,
+    "birthdays": handle_upcoming_birthdays,
+    "exit": lambda book: "Exiting the program...",
+    "close": lambda book: "Closing the program..."
+}
 
 def main():
     book = AddressBook()
-    commands = {
-        "add": handle_add_contact,
-        "list": handle_list_contacts,
-        "get": handle_get_contact,
-        "remove": handle_remove_contact,
-        "edit": handle_edit_contact_phone,
-        "birthdays": handle_upcoming_birthdays,
-        "exit": lambda book: "Exiting the program...",
-        "close": lambda book: "Closing the program..."
-    }
-
     print("Welcome to the Address Book!")
     while True:
-        command = input("Enter command (add, list, get, remove, edit, birthdays, exit, close): ").strip().lower()
+        user_input = input("Enter command (add, list, get, remove, edit, birthdays, exit, close): ")
+        parts = user_input.split(maxsplit=1)
+        command = parts[0].lower() if parts else ""
+        rest = parts[1] if len(parts) > 1 else ""
         if command in ["exit", "close"]:
-            print(commands[command](book))
+            print(HANDLERS[command](book))
             break
-        elif command in commands:
+        elif command in HANDLERS:
             if command == "add":
-                name = input("Enter name: ").strip()
-                phone = input("Enter phone: ").strip()
-                email = input("Enter email: ").strip()  
-                favorite = input("Is favorite (True/False): ").strip().lower() == 'true'
-                birthday = input("Enter birthday (DD.MM.YYYY) or leave empty: ").strip()
+                # The contact can be given on one line as "add name,phone,email,favorite,birthday"
+                # or as a comma-separated answer to the first prompt; otherwise prompt for each field.
+                line = rest.strip() or input("Enter name (or name,phone,email,favorite,birthday): ").strip()
+                if "," in line:
+                    fields = [field.strip() for field in line.split(",")]
+                    if len(fields) > 5:
+                        print("Too many fields. Use: name,phone,email,favorite,birthday")
+                        continue
+                    name, phone, email, favorite, birthday = fields + [""] * (5 - len(fields))
+                else:
+                    name = line
+                    phone = input("Enter phone: ").strip()
+                    email = input("Enter email: ").strip()  
+                    favorite = input("Is favorite (True/False): ").strip()
+                    birthday = input("Enter birthday (DD.MM.YYYY) or leave empty: ").strip()
+                favorite = favorite.lower() == 'true'
                 birthday = birthday if birthday else None
-                print(commands[command](book, name, phone, email, favorite, birthday))
+                print(HANDLERS[command](book, name, phone, email, favorite, birthday))
             elif command == "list":
-                print(commands[command](book))
+                print(HANDLERS[command](book))
             elif command == "get":
                 name = input("Enter name: ").strip()
-                print(commands[command](book, name))
+                print(HANDLERS[command](book, name))
             elif command == "remove":
                 name = input("Enter name: ").strip()
-                print(commands[command](book, name))
+                print(HANDLERS[command](book, name))
             elif command == "edit":
                 name = input("Enter name: ").strip()
                 old_phone = input("Enter old phone: ").strip()
                 new_phone = input("Enter new phone: ").strip()
-                print(commands[command](book, name, old_phone, new_phone))
+                print(HANDLERS[command](book, name, old_phone, new_phone))
             elif command == "birthdays":
                 days = input("Enter number of days (default 7): ").strip()
                 days = int(days) if days else 7
-                print(commands[command](book, days))
+                print(HANDLERS[command](book, days))
         else:
             print("Invalid command. Please try again.")
 
@@ -1,84 +1,142 @@
 from collections import UserDict
-import re
-from datetime import datetime, timedelta
+import calendar
+from datetime import date, timedelta
+from functools import lru_cache
 
-# Base class for record fields
-class Field:
-    def __init__(self, value):
-        self.value = value
-
-    def __str__(self):
-        return str(self.value)
-
-# Class for storing the name of a contact
-class Name(Field):
-    pass
+# Maps ASCII digit bytes to 0 and every other byte to 1.
+_DIGITS_LUT = bytes(0 if 48 <= b <= 57 else 1 for b in range(256))
 
-# Class for storing a phone number with validation for format (10 digits)
-class Phone(Field):
-    def __init__(self, value):
-        if self._validate(value):
-            super().__init__(value)
-        else:
-            raise ValueError("Invalid phone number format. It should be 10 digits.")
-
-    def _validate(self, value):
-        return re.fullmatch(r"\d{10}", value) is not None
+@lru_cache(maxsize=1024)
+def _validate_phone(value):
+    # Check the phone number format (10 digits). Cached for repeated numbers.
+    # Non-ASCII characters are encoded as "?" and so are rejected too.
+    if len(value) != 10:
+        return False
+    return b"\x01" not in value.encode("ascii", "replace").translate(_DIGITS_LUT)
 
 # Class for storing a birthday with validation for date format (DD.MM.YYYY)
-class Birthday(Field):
+class Birthday:
+    __slots__ = ("value", "formatted")
+
     def __init__(self, value):
+        # Split by hand instead of strptime. Same DD.MM.YYYY layout, but unlike
+        # strptime (whose \d matches any Unicode digit) only ASCII digits are accepted.
         try:
-            self.value = datetime.strptime(value, "%d.%m.%Y")
+            day, month, year = value.split(".")
+            # strptime's %d also accepts a space-padded day such as " 1".
+            if len(day) == 2 and day[0] == " ":
+                day = day[1:]
+            digits = day + month + year
+            if not (len(day) <= 2 and len(month) <= 2 and len(year) == 4
+                    and digits.isascii() and digits.isdigit()):
+                raise ValueError
+            self.value = date(int(year), int(month), int(day))
         except ValueError:
             raise ValueError("Invalid date format. Use DD.MM.YYYY")
+        # Format once here so displaying the birthday is a plain attribute read.
+        self.formatted = f"{self.value.day:02d}.{self.value.month:02d}.{self.value.year:04d}"
+
+    def __str__(self):
+        return self.formatted
 
 # Class for storing information about a contact
 class Record:
+    __slots__ = ("name", "phones", "birthday", "_str_cache", "_book")
+
     def __init__(self, name):
-        self.name = Name(name)  
-        self.phones = []  
+        # Name and phones are stored as plain strings.
+        self.name = name
+        self.phones = {}  # phone -> phone, keeps insertion order
         self.birthday = None  
+        self._str_cache = None  # rendered __str__, reset on every change
+        self._book = None  # AddressBook holding the record, kept by the book
 
     def add_phone(self, phone):
         # Add a new phone number to the contact.
-        self.phones.append(Phone(phone))
+        if not _validate_phone(phone):
+            raise ValueError("Invalid phone number format. It should be 10 digits.")
+        self.phones[phone] = phone
+        self._str_cache = None
 
     def remove_phone(self, phone):
         # Remove a phone number from the contact.
-        phone_to_remove = self.find_phone(phone)
-        if phone_to_remove:
-            self.phones.remove(phone_to_remove)
+        self.phones.pop(phone, None)
+        self._str_cache = None
 
     def edit_phone(self, old_phone, new_phone):
         # Edit a phone number in the contact.
-        phone_to_edit = self.find_phone(old_phone)
-        if phone_to_edit:
-            self.phones.remove(phone_to_edit)
+        if old_phone in self.phones:
+            # add_phone raises before changing anything if new_phone is invalid.
             self.add_phone(new_phone)
+            if new_phone != old_phone:
+                del self.phones[old_phone]
+            self._str_cache = None
 
     def find_phone(self, phone):
-        # Find a phone number in the list.
-        for p in self.phones:
-            if p.value == phone:
-                return p
-        return None
+        # Find a phone number of the contact.
+        return self.phones.get(phone)
 
     def add_birthday(self, birthday):
         # Add a birthday to the contact. 
-        self.birthday = Birthday(birthday)
+        birthday = Birthday(birthday)
+        # Keep the birthday index of the containing address book up to date.
+        if self._book is not None:
+            self._book._unindex_birthday(self)
+        self.birthday = birthday
+        self._str_cache = None
+        if self._book is not None:
+            self._book._index_birthday(self)
 
     def __str__(self):
         # Return a string representation of the contact in a readable format. 
-        phones = '; '.join(p.value for p in self.phones)
-        birthday = self.birthday.value.strftime("%d.%m.%Y") if self.birthday else "N/A"
-        return f"Contact name: {self.name.value}, phones: {phones}, birthday: {birthday}"
+        if self._str_cache is None:
+            phones = '; '.join(self.phones)
+            birthday = self.birthday.formatted if self.birthday else "N/A"
+            self._str_cache = f"Contact name: {self.name}, phones: {phones}, birthday: {birthday}"
+        return self._str_cache
 
 # Class for managing and storing address book records
 class AddressBook(UserDict):
+    def __init__(self):
+        # (month, day) -> records with a birthday on that day
+        self._by_mmdd = {}
+        super().__init__()
+
+    def _index_birthday(self, record):
+        # Add a record to the birthday index.
+        if record.birthday:
+            key = (record.birthday.value.month, record.birthday.value.day)
+            self._by_mmdd.setdefault(key, []).append(record)
+
+    def _unindex_birthday(self, record):
+        # Remove a record from the birthday index.
+        if record.birthday:
+            key = (record.birthday.value.month, record.birthday.value.day)
+            records = self._by_mmdd.get(key, [])
+            if record in records:
+                records.remove(record)
+
+    def __setitem__(self, name, record):
+        # Every insertion (including update/setdefault) goes through here,
+        # so the birthday index is maintained in one place.
+        # A record belongs to one address book at a time.
+        old_record = self.data.get(name)
+        if old_record:
+            self._unindex_birthday(old_record)
+            old_record._book = None
+        self.data[name] = record
+        record._book = self
+        self._index_birthday(record)
+
+    def __delitem__(self, name):
+        # Every removal (including pop/popitem/clear) goes through here.
+        record = self.data.pop(name)
+        self._unindex_birthday(record)
+        record._book = None
+
     def add_record(self, record):
         # Add a record to the address book. 
-        self.data[record.name.value] = record
+        self[record.name] = record
 
     def find(self, name):
         # Find a record by name.
@@ -87,18 +145,24 @@ class AddressBook(UserDict):
     def delete(self, name):
         # Delete a record by name.
         if name in self.data:
-            del self.data[name]
+            del self[name]
 
     def get_upcoming_birthdays(self, days=7):
         # Return a list of contacts with upcoming birthdays within the next few days.
-        today = datetime.now()
+        by_mmdd = self._by_mmdd
+        one_day = timedelta(days=1)
+        day = date.today()
         upcoming_birthdays = []
-        for record in self.data.values():
-            if record.birthday:
-                next_birthday = record.birthday.value.replace(year=today.year)
-                if today <= next_birthday <= (today + timedelta(days=days)):
-                    upcoming_birthdays.append(record)
-        return upcoming_birthdays
+        # A year covers every birthday; walking further would only repeat dates.
+        for _ in range(min(days, 365) + 1):
+            month, mday = day.month, day.day
+            upcoming_birthdays.extend(by_mmdd.get((month, mday), ()))
+            # Feb 29 birthdays are celebrated on Feb 28 in non-leap years.
+            if month == 2 and mday == 28 and not calendar.isleap(day.year):
+                upcoming_birthdays.extend(by_mmdd.get((2, 29), ()))
+            day += one_day
+        # A full-year window can reach today's date again (or fold Feb 29 twice).
+        return list(dict.fromkeys(upcoming_birthdays))
 
 def input_error(func):
     # Decorator to handle input errors.
@@ -140,7 +204,7 @@ def show_phone(args, book: AddressBook):
     name = args[0]
     record = book.find(name)
     if record:
-        return f"{name}'s phones: {', '.join(p.value for p in record.phones)}"
+        return f"{name}'s phones: {', '.join(record.phones)}"
     else:
         return f"Contact {name} not found."
 
@@ -149,10 +213,7 @@ def list_contacts(args, book: AddressBook):
     # List all contacts in the address book.
     if not book.data:
         return "Address book is empty."
-    result = ["Contacts in address book:"]
-    for name, record in book.data.items():
-        result.append(str(record))
-    return "\n".join(result)
+    return "Contacts in address book:\n" + "\n".join(str(record) for record in book.data.values())
 
 @input_error
 def add_birthday(args, book: AddressBook):
@@ -172,7 +233,7 @@ def show_birthday(args, book: AddressBook):
     record = book.find(name)
     if record:
         if record.birthday:
-            return f"{name}'s birthday is on {record.birthday.value.strftime('%d.%m.%Y')}."
+            return f"{name}'s birthday is on {record.birthday.formatted}."
         else:
             return f"Birthday not set for contact {name}."
     else:
@@ -185,18 +246,29 @@ def birthdays(args, book: AddressBook):
     upcoming_birthdays = book.get_upcoming_birthdays(days)
     if not upcoming_birthdays:
         return "No upcoming birthdays within the next week."
-    result = ["Upcoming birthdays:"]
-    for record in upcoming_birthdays:
-        result.append(f"{record.name.value} on {record.birthday.value.strftime('%d.%m.%Y')}")
-    return "\n".join(result)
+    return "Upcoming birthdays:\n" + "\n".join(
+        f"{record.name} on {record.birthday.formatted}" for record in upcoming_birthdays
+    )
 
 def parse_input(user_input):
     # Parse user input into command and arguments.
-    parts = user_input.split()
+    parts = user_input.split(maxsplit=1)
+    if not parts:
+        return "", []
     command = parts[0].lower()
-    args = parts[1:]
+    args = parts[1].split() if len(parts) > 1 else []
     return command, args
 
+HANDLERS = {
+    "add": add_contact,
+    "change": change_phone,
+    "phone": show_phone,
+    "all": list_contacts,
+    "add-birthday": add_birthday,
+    "show-birthday": show_birthday,
+    "birthdays": birthdays,
+}
+
 def main():
     book = AddressBook()
     print("Welcome to the assistant bot!")
@@ -211,26 +283,8 @@ def main():
         elif command == "hello":
             print("How can I help you?")
 
-        elif command == "add":
-            print(add_contact(args, book))
-
-        elif command == "change":
-            print(change_phone(args, book))
-
-        elif command == "phone":
-            print(show_phone(args, book))
-
-        elif command == "all":
-            print(list_contacts(args, book))
-
-        elif command == "add-birthday":
-            print(add_birthday(args, book))
-
-        elif command == "show-birthday":
-            print(show_birthday(args, book))
-
-        elif command == "birthdays":
-            print(birthdays(args, book))
+        elif command in HANDLERS:
+            print(HANDLERS[command](args, book))
 
         else:
             print("Invalid command.")